@@ -7,6 +7,8 @@
 import xlrd
 import os
 import csv
+import numpy as np
+import pandas as pd
 from zipfile import ZipFile
 
 datafile = "2013_ERCOT_Hourly_Load_Data.xls"
@@ -19,39 +21,34 @@ def open_zip(datafile):
 
 
 def parse_file(datafile):
-    workbook = xlrd.open_workbook(datafile)
-    sheet = workbook.sheet_by_index(0)
-    
+    # only the first sheet is needed, so skip loading the others
+    workbook = xlrd.open_workbook(datafile, on_demand=True, formatting_info=False)
+    try:
+        df = pd.read_excel(workbook, sheet_name=0, header=0, engine='xlrd')
+    finally:
+        workbook.release_resources()
+
     data = []
-    sheet_data = [[sheet.cell_value(r, col)
-                     for col in range(sheet.ncols)]
-                         for r in range(sheet.nrows)]
-    header = sheet_data[0]
     data.append(['Station', 'Year', 'Month', 'Day', 'Hour', 'Max Load'])
-    
-    time_data = sheet.col_values(0, start_rowx=1)
-    
-    for i in range(1, len(header)-1):
-        region_name = header[i]
-        region_data = sheet.col_values(i, start_rowx=1)
-        maxvalue = max(region_data)
-        iMax = region_data.index(maxvalue)
-        maxtime = xlrd.xldate_as_tuple(time_data[iMax], 0)
-
-        region_data = [region_name]
-        for i in range(4): region_data.append(maxtime[i])
-        region_data.append(maxvalue)
-        data.append(region_data)
+
+    # region columns sit between the time column and the ERCOT total
+    regions = df.iloc[:, 1:-1]
+    loads = regions.to_numpy(dtype=np.float64)
+    iMax = loads.argmax(axis=0)
+    maxvalues = loads[iMax, np.arange(loads.shape[1])]
+    time_data = df.iloc[:, 0].to_numpy()
+
+    for region_name, i, maxvalue in zip(regions.columns, iMax, maxvalues):
+        maxtime = pd.Timestamp(time_data[i]).round('s')
+        data.append([region_name, maxtime.year, maxtime.month, maxtime.day,
+                     maxtime.hour, float(maxvalue)])
 
     return data
 
 def save_file(data, filename):
-    with open(filename, 'wb') as f:
+    with open(filename, 'wb', 1 << 20) as f:
         w = csv.writer(f, delimiter='|')
-        for region_data in data:
-            w.writerow(region_data)
-    
-    return None
+        w.writerows(data)
 
     
 def test():
@@ -2,7 +2,11 @@
 # We have provided an example json output here for you to look at,
 # but you will not be able to run any queries through our UI.
 import json
+import sys
+import time
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
 
 
 BASE_URL = "http://musicbrainz.org/ws/2/"
@@ -13,11 +17,22 @@ query_type = {  "simple": {},
                 "aliases": {"inc": "aliases"},
                 "releases": {"inc": "releases"}}
 
+# MusicBrainz allows about one request per second, so responses are cached
+# locally and uncached requests are spaced out.
+SESSION = requests_cache.CachedSession("mb_cache", expire_after=3600)
+SESSION.headers.update({
+    "User-Agent": "data-wrangling/0.1 (https://github.com/bestkao/data-wrangling-with-openstreetmap-and-mongodb)",
+    "Accept-Encoding": "gzip"})
+SESSION.mount("http://", HTTPAdapter(pool_connections=4))
+TIMEOUT = 10
+
 
 def query_site(url, params, uid="", fmt="json"):
     params["fmt"] = fmt
-    r = requests.get(url + uid, params=params)
+    r = SESSION.get(url + uid, params=params, timeout=TIMEOUT)
     print "requesting", r.url
+    if not getattr(r, "from_cache", False):
+        time.sleep(1.05)
 
     if r.status_code == requests.codes.ok:
         return r.json()
@@ -32,7 +47,8 @@ def query_by_name(url, params, name):
 
 def pretty_print(data, indent=4):
     if type(data) == dict:
-        print json.dumps(data, indent=indent, sort_keys=True)
+        json.dump(data, sys.stdout, indent=indent, sort_keys=True)
+        sys.stdout.write("\n")
     else:
         print data
 
@@ -57,7 +73,7 @@ def main():
 
     results = query_by_name(ARTIST_URL, query_type["simple"], "First Aid Kit")
     print "\nNUMBER OF BANDS NAMED 'FIRST AID KIT':"
-    pretty_print(len([result for result in results["artists"] if result["name"] == "First Aid Kit"]))
+    pretty_print(sum(1 for result in results["artists"] if result["name"] == "First Aid Kit"))
 
     results = query_by_name(ARTIST_URL, query_type["simple"], "Queen")
     print "\nBEGIN_AREA NAME FOR QUEEN:"
@@ -66,7 +82,8 @@ def main():
     results = query_by_name(ARTIST_URL, query_type["simple"], "Beatles")
     print "\nSPANISH ALIAS FOR BEATLES:"
     aliases = results["artists"][0]["aliases"]
-    pretty_print((alias for alias in aliases if alias["locale"] == "es").next()["name"])
+    alias = next((alias for alias in aliases if alias.get("locale") == "es"), None)
+    pretty_print(alias["name"] if alias else None)
 
     results = query_by_name(ARTIST_URL, query_type["simple"], "Nirvana")
     print "\nNIRVANA DISAMBIGUATION:"
@@ -21,8 +21,10 @@
 #         },
 #         {"courier": "..."}
 # ]
-from bs4 import BeautifulSoup
+from lxml import html
 from zipfile import ZipFile
+from multiprocessing import Pool
+from itertools import chain
 import os
 
 datadir = "data"
@@ -54,24 +56,25 @@ def process_file(f):
     ]
     """
     data = []
-    info = {}
-    info["courier"], info["airport"] = f[:6].split("-")
+    courier, airport = f[:6].split("-")
     # Note: create a new dictionary for each entry in the output data list.
     # If you use the info dictionary defined here each element in the list 
     # will be a reference to the same info dictionary.
-    with open("{}/{}".format(datadir, f), "r") as html:
-
-        soup = BeautifulSoup(html)
-        entries = soup.find('table', 'dataTDRight').find_all('tr', 'dataTDRight')
-        for e in entries:
-            entryData = e.find_all('td')
-            if entryData[1].text != 'TOTAL':
-                info['year']    = int(entryData[0].text)
-                info['month']   = int(entryData[1].text)
-                info['flights'] = {}
-                info['flights']['domestic'] = int(entryData[2].text.replace(',', ''))
-                info['flights']['international'] = int(entryData[3].text.replace(',', ''))
-                data.append(info)
+    tree = html.parse("{}/{}".format(datadir, f))
+    entries = tree.xpath('//table[@class="dataTDRight"]/tr[@class="dataTDRight"]')
+    for e in entries:
+        year, month, domestic, international = [
+            td.text_content() for td in e.xpath('td[position() <= 4]')]
+        if month != 'TOTAL':
+            info = {}
+            info["courier"], info["airport"] = courier, airport
+            info['year']    = int(year)
+            info['month']   = int(month)
+            info['flights'] = {}
+            # str.translate with deletechars strips the thousands separators in C
+            info['flights']['domestic'] = int(domestic.translate(None, ','))
+            info['flights']['international'] = int(international.translate(None, ','))
+            data.append(info)
 
     return data
 
@@ -80,9 +83,14 @@ def test():
     print "Running a simple test..."
     open_zip(datadir)
     files = process_all(datadir)
-    data = []
-    for f in files:
-        data += process_file(f)
+    # files are independent, so parse them across all cores
+    pool = Pool()
+    try:
+        data = list(chain.from_iterable(
+            pool.imap(process_file, files, chunksize=8)))
+    finally:
+        pool.close()
+        pool.join()
         
     assert len(data) == 399  # Total number of rows
     for entry in data[:3]:
@@ -6,8 +6,10 @@
 # So, one solution would be to split the file into separate documents,
 # so that you can process the resulting files as valid XML documents.
 
+import mmap
 import xml.etree.ElementTree as ET
 PATENTS = 'patent.data'
+XML_DECL = b"<?xml"
 
 def get_root(fname):
     tree = ET.parse(fname)
@@ -20,28 +22,21 @@ def split_file(filename):
     # As a hint - each patent declaration starts with the same line that was causing the error
     # The new files should be saved with filename in the following format:
     # "{}-{}".format(filename, n) where n is a counter, starting from 0.
+    with open(filename, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
     try:
-        files = []
-        n = len(files)
-        lines = []
-        
-        f = open(filename, "r")
-        for line in f:            
-            lines.append(line)
-            if line.startswith("<?xml") and n == 0: n += 1
-            elif line.startswith("<?xml"):
-                f = open("{}-{}".format(filename, n-1), 'w')
-                if lines[-1].startswith("<?xml"):
-                    for l in lines[:-1]:
-                        f.write(l)
-                lines = [lines[-1]]
-                n += 1
-        
-        f = open("{}-{}".format(filename, n-1), 'w')
-        for l in lines:
-            f.write(l)
-    except:
-        print 'cant open'
+        start, n = 0, 0
+        while True:
+            # a new document starts wherever a line begins with the declaration
+            nxt = buf.find(b"\n" + XML_DECL, start)
+            end = nxt + 1 if nxt != -1 else len(buf)
+            with open("{}-{}".format(filename, n), "wb") as out:
+                out.write(buf[start:end])
+            if nxt == -1:
+                break
+            start, n = end, n + 1
+    finally:
+        buf.close()
 
 def test():
     split_file(PATENTS)
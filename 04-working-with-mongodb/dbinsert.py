@@ -1,15 +1,22 @@
-import json
+import ijson
+from itertools import islice
+
+CHUNK_SIZE = 1000
 
 def insert_data(data, db):
-    db.arachnid.insert(data)
+    data = iter(data)
+    chunk = list(islice(data, CHUNK_SIZE))
+    while chunk:
+        db.arachnid.insert_many(chunk, ordered=False)
+        chunk = list(islice(data, CHUNK_SIZE))
 
 if __name__ == "__main__":
-    
+
     from pymongo import MongoClient
     client = MongoClient("mongodb://localhost:27017")
     db = client.examples
 
     with open('arachnid.json') as f:
-        data = json.loads(f.read())
+        data = ijson.items(f, 'item', use_float=True)
         insert_data(data, db)
-        print db.arachnid.find_one()
\ No newline at end of file
+        print db.arachnid.find_one()
@@ -9,17 +9,16 @@ Your task in this exercise has two steps:
     The function takes a string with street name as an argument and should return the fixed name
     We have provided a simple test so that you see what exactly is expected
 """
-import xml.etree.cElementTree as ET
+import xml.sax
 from collections import defaultdict
-import re
 import pprint
 
 OSMFILE = "san-francisco_california.osm"
-street_type_re = re.compile(r'\b\S+\.?$', re.IGNORECASE)
 
 
 expected = ["Street", "Avenue", "Boulevard", "Drive", "Court", "Place", "Square", "Lane", "Road",
             "Trail", "Parkway", "Commons"]
+EXPECTED = frozenset(expected)
 
 # UPDATE THIS VARIABLE
 mapping = { 'Av': 'Avenue',
@@ -46,37 +45,45 @@ mapping = { 'Av': 'Avenue',
 
 
 def audit_street_type(street_types, street_name):
-    m = street_type_re.search(street_name)
-    if m:
-        street_type = m.group()
-        if street_type not in expected:
-            street_types[street_type].add(street_name)
+    street_type = street_name.rstrip().rpartition(' ')[2]
+    if street_type and street_type not in EXPECTED:
+        street_types[street_type].add(street_name)
 
 
-def is_street_name(elem):
-    return (elem.attrib['k'] == "addr:street")
+def is_street_name(attrs):
+    return (attrs.get('k') == "addr:street")
 
 
-def audit(osmfile):
-    osm_file = open(osmfile, "r")
-    street_types = defaultdict(set)
-    for event, elem in ET.iterparse(osm_file, events=("start",)):
+class StreetHandler(xml.sax.ContentHandler):
+    """SAX handler auditing the addr:street tags of nodes and ways
+    without building the document tree."""
+
+    def __init__(self):
+        xml.sax.ContentHandler.__init__(self)
+        self.street_types = defaultdict(set)
+        self.in_ok = False
+
+    def startElement(self, name, attrs):
+        if name == "node" or name == "way":
+            self.in_ok = True
+        elif name == "tag" and self.in_ok and is_street_name(attrs):
+            audit_street_type(self.street_types, attrs['v'])
 
-        if elem.tag == "node" or elem.tag == "way":
-            for tag in elem.iter("tag"):
-                if is_street_name(tag):
-                    audit_street_type(street_types, tag.attrib['v'])
+    def endElement(self, name):
+        if name == "node" or name == "way":
+            self.in_ok = False
 
-    return street_types
+
+def audit(osmfile):
+    handler = StreetHandler()
+    xml.sax.parse(osmfile, handler)
+    return handler.street_types
 
 
 def update_name(name, mapping):
-    m = street_type_re.search(name)
-    if m:
-        street_type = m.group()
-        name.replace(street_type, mapping[street_type])
-        #if street_type in mapping:
-    #        name = name.split(street_type)[0] + mapping[street_type] + name.split(street_type)[1]
+    head, sep, street_type = name.rpartition(' ')
+    if street_type in mapping:
+        name = head + sep + mapping[street_type]
 
     return name
 
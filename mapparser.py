@@ -10,15 +10,24 @@ the map as value.
 
 Note that your code will be tested with a different data file than the 'example.osm'
 """
-import xml.etree.cElementTree as ET
+from lxml import etree as ET
+from collections import Counter
 import pprint
 
+def iter_tags(filename):
+    for event, elem in ET.iterparse(filename, events=('end',)):
+        tag = elem.tag
+        # drop the parsed subtree so memory stays flat on large map files
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+        yield tag
+
+
 def count_tags(filename):
-    tags = {}
-    for event, elem in ET.iterparse(filename):
-        if elem.tag in tags: tags[elem.tag] += 1
-        else:                tags[elem.tag] = 1
-    return tags
+    tags = Counter()
+    tags.update(iter_tags(filename))
+    return dict(tags)
 
 
 
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-import xml.etree.cElementTree as ET
+from lxml import etree as ET
 import pprint
 import re
 """
@@ -12,17 +12,19 @@ The function process_map should return a set of unique user IDs ("uid")
 """
 
 def get_user(element):
-    users = set()
-    for e in element:
-        if 'uid' in e.attrib:
-            users.add(e.attrib['uid'])
-    return users
+    return element.get('uid')
 
 
 def process_map(filename):
     users = set()
-    for _, element in ET.iterparse(filename):
-        users = get_user(element)
+    for _, element in ET.iterparse(filename, events=('end',),
+                                   tag=('node', 'way', 'relation', 'changeset')):
+        users.add(get_user(element))
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+    # elements edited anonymously carry no uid
+    users.discard(None)
 
     return users
 